@@ -23,13 +23,17 @@ import datetime
 import importlib.util
 import logging
 import os
+from dataclasses import dataclass, field
+from typing import Callable
 
-from PySide6.QtCore import QLocale, Qt, Signal, Slot
-from PySide6.QtGui import QDoubleValidator, QIcon, QIntValidator, QPalette
+import numpy as np
+from PySide6.QtCore import QLocale, QMetaMethod, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QCloseEvent, QDoubleValidator, QIcon, QIntValidator, QPalette
 from PySide6.QtWidgets import (
     QApplication,
     QDialog,
     QFileDialog,
+    QListWidgetItem,
     QMainWindow,
     QMessageBox,
     QWidget,
@@ -158,11 +162,17 @@ class _AddSourceDialog(QDialog, Ui_AddSourceDialog):
         self._configWidget = data_source.getConfigWidget(DataSourceType.SERIAL, self)
         self.sourceConfigContainer.addWidget(self._configWidget)
 
+        self.reset()
+
+        self.destroyed.connect(self.deleteLater)
+
+    def reset(self) -> None:
+        """Reset the form so that the dialog can be re-used."""
         self._dataSourceConfig = {}
         self._isValid = False
         self._errMessage = ""
-
-        self.destroyed.connect(self.deleteLater)
+        self.interfaceModulePathLabel.setText("")
+        self.interfaceModulePathLabel.setToolTip("")
 
     @property
     def dataSourceConfig(self) -> dict:
@@ -179,6 +189,7 @@ class _AddSourceDialog(QDialog, Ui_AddSourceDialog):
         """str: Property for getting the error message if the form is not valid."""
         return self._errMessage
 
+    @Slot()
     def _browseInterfaceModule(self) -> None:
         """Browse files to select the module containing the decode function."""
         filePath, _ = QFileDialog.getOpenFileName(
@@ -208,6 +219,7 @@ class _AddSourceDialog(QDialog, Ui_AddSourceDialog):
             self.interfaceModulePathLabel.setText(displayText)
             self.interfaceModulePathLabel.setToolTip(filePath)
 
+    @Slot()
     def _onSourceChange(self) -> None:
         """Detect if source type has changed."""
         # Clear container
@@ -220,6 +232,7 @@ class _AddSourceDialog(QDialog, Ui_AddSourceDialog):
         )
         self.sourceConfigContainer.addWidget(self._configWidget)
 
+    @Slot()
     def _addSourceHandler(self) -> None:
         """Validate user input in the form."""
 
@@ -260,6 +273,11 @@ class _AddSignalDialog(QDialog, Ui_AddSignalDialog):
         Sampling frequency.
     parent : QWidget or None, default=None
         Parent widget.
+
+    Attributes
+    ----------
+    _outDirPath : str or None
+        Path to the directory where the data will be saved.
     """
 
     def __init__(
@@ -279,11 +297,6 @@ class _AddSignalDialog(QDialog, Ui_AddSignalDialog):
         self.filtTypeComboBox.currentTextChanged.connect(self._onFiltTypeChange)
         self.browseOutDirButton.clicked.connect(self._browseOutDir)
 
-        self.sourceNameLabel.setText(sourceName)
-        self.sigNameLabel.setText(sigName)
-        self.nChLabel.setText(str(nCh))
-        self.freqLabel.setText(str(fs))
-
         # Validation rules
         nDec = 3
         minFreq, maxFreq = 1 * 10 ** (-nDec), 20_000.0
@@ -309,6 +322,44 @@ class _AddSignalDialog(QDialog, Ui_AddSignalDialog):
         renderLenValidator = QIntValidator(bottom=1, top=8)
         self.renderLenTextField.setValidator(renderLenValidator)
 
+        self._outDirPath: str | None = None
+        self.reset(sourceName, sigName, nCh, fs)
+
+        self.destroyed.connect(self.deleteLater)
+
+    def reset(self, sourceName: str, sigName: str, nCh: int, fs: float) -> None:
+        """
+        Reset the form to its default values for a new signal, so that the dialog
+        can be re-used.
+
+        Parameters
+        ----------
+        sourceName : str
+            Name of the source.
+        sigName : str
+            Name of the signal.
+        nCh : int
+            Number of channels.
+        fs : float
+            Sampling frequency.
+        """
+        self.sourceNameLabel.setText(sourceName)
+        self.sigNameLabel.setText(sigName)
+        self.nChLabel.setText(str(nCh))
+        self.freqLabel.setText(str(fs))
+        self.filteringGroupBox.setChecked(False)
+        self.filtTypeComboBox.setCurrentIndex(0)
+        self.freq1TextField.clear()
+        self.freq2TextField.clear()
+        self.filtOrderTextField.clear()
+        self.fileSavingGroupBox.setChecked(False)
+        self._outDirPath = None
+        self.outDirPathLabel.clear()
+        self.outDirPathLabel.setToolTip("")
+        self.fileNameTextField.clear()
+        self.chSpacingTextField.setText("100")
+        self.renderLenTextField.setText("4")
+
         self._signalConfig = {}
         self._signalConfig["source"] = sourceName
         self._signalConfig["sigName"] = sigName
@@ -317,8 +368,6 @@ class _AddSignalDialog(QDialog, Ui_AddSignalDialog):
         self._isValid = False
         self._errMessage = ""
 
-        self.destroyed.connect(self.deleteLater)
-
     @property
     def signalConfig(self) -> dict:
         """dict: Property for getting the dictionary with the signal configuration."""
@@ -334,6 +383,7 @@ class _AddSignalDialog(QDialog, Ui_AddSignalDialog):
         """str: Property for getting the error message if the form is not valid."""
         return self._errMessage
 
+    @Slot()
     def _onFiltTypeChange(self) -> None:
         """Detect if filter type has changed."""
         filtType = self.filtTypeComboBox.currentText()
@@ -344,6 +394,7 @@ class _AddSignalDialog(QDialog, Ui_AddSignalDialog):
         else:
             self.freq2TextField.setEnabled(True)
 
+    @Slot()
     def _browseOutDir(self) -> None:
         """Browse directory where the data will be saved."""
         outDirPath = QFileDialog.getExistingDirectory(
@@ -353,7 +404,7 @@ class _AddSignalDialog(QDialog, Ui_AddSignalDialog):
             QFileDialog.ShowDirsOnly,
         )
         if outDirPath != "":
-            self._signalConfig["filePath"] = outDirPath
+            self._outDirPath = outDirPath
 
             displayText = (
                 outDirPath
@@ -363,6 +414,7 @@ class _AddSignalDialog(QDialog, Ui_AddSignalDialog):
             self.outDirPathLabel.setText(displayText)
             self.outDirPathLabel.setToolTip(outDirPath)
 
+    @Slot()
     def _formValidationHandler(self) -> None:
         """Validate user input in the form."""
         lo = QLocale()
@@ -412,22 +464,16 @@ class _AddSignalDialog(QDialog, Ui_AddSignalDialog):
 
         # Check file saving settings
         if self.fileSavingGroupBox.isChecked():
-            if "filePath" not in self._signalConfig.keys():
+            if self._outDirPath is None:
                 self._isValid = False
                 self._errMessage = "Select an output directory."
                 return
             outFileName = self.fileNameTextField.text()
             if outFileName == "":
-                outFileName = (
-                    f"{self._signalConfig["sigName"]}_{datetime.datetime.now()}"
-                    .replace(" ", "_")
-                    .replace(":", "-")
-                    .replace(".", "-")
-                )
+                timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
+                outFileName = f"{self._signalConfig['sigName']}_{timestamp}"
             outFileName = f"{outFileName}.bin"
-            self._signalConfig["filePath"] = os.path.join(
-                self._signalConfig["filePath"], outFileName
-            )
+            self._signalConfig["filePath"] = os.path.join(self._outDirPath, outFileName)
 
         # Plot settings
         if not self.chSpacingTextField.hasAcceptableInput():
@@ -444,20 +490,72 @@ class _AddSignalDialog(QDialog, Ui_AddSignalDialog):
         self._isValid = True
 
 
+@dataclass(slots=True)
+class _SourceRecord:
+    """
+    Dataclass grouping the state associated to a source.
+
+    Attributes
+    ----------
+    streamController : StreamingController
+        StreamingController object of the source.
+    sigNames : list of str
+        Names of the signals associated to the source.
+    """
+
+    streamController: StreamingController
+    sigNames: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _SignalRecord:
+    """
+    Dataclass grouping the state associated to a signal.
+
+    Attributes
+    ----------
+    source : str
+        Name of the source the signal belongs to.
+    plotWidget : SignalPlotWidget
+        SignalPlotWidget object displaying the signal.
+    plotFn : Callable
+        Bound addData method of the SignalPlotWidget object.
+    refreshFn : Callable
+        Bound refreshPlot method of the SignalPlotWidget object.
+    listItem : QListWidgetItem
+        Item of the list of signal names.
+    """
+
+    source: str
+    plotWidget: SignalPlotWidget
+    plotFn: Callable[[np.ndarray], None]
+    refreshFn: Callable[[], None]
+    listItem: QListWidgetItem
+
+
 class MainWindow(QMainWindow, Ui_MainWindow):
     """
     Main window.
 
     Attributes
     ----------
-    _streamControllers : dict of str: StreamingController
-        Dictionary of StreamingController objects indexed by their string representation.
-    _sigPlotWidgets : dict of str: SignalPlotWidget
-        List of SignalPlotWidget objects indexed by their names.
-    _source2sigMap : dict of str: list of str
-        Mapping between source and signal name.
-    _sig2sourceMap : dict of str: str
-        Mapping between signal and source name.
+    _sources : dict of str: _SourceRecord
+        Dictionary of source records indexed by the name of the source.
+    _signals : dict of str: _SignalRecord
+        Dictionary of signal records indexed by the name of the signal.
+    _plotTimer : QTimer
+        Timer for forwarding the data buffered by the streaming controllers to the plots
+        and refreshing them.
+    _adjustLayoutTimer : QTimer
+        Single-shot timer for coalescing consecutive re-adjustments of the plots layout.
+    _forwardingData : bool
+        Whether the filtered data of the streaming controllers is being forwarded via dataReadySig.
+    _dataReadySigMeta : QMetaMethod
+        Meta-method of dataReadySig, used to check whether it has receivers.
+    _addSourceDialog : _AddSourceDialog or None
+        Dialog for adding a source (created on first use, then re-used).
+    _addSignalDialog : _AddSignalDialog or None
+        Dialog for adding a signal (created on first use, then re-used).
 
     Class attributes
     ----------------
@@ -468,7 +566,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     closeSig : Signal
         Qt Signal emitted when the application is closed.
     dataReadySig : Signal
-        Qt Signal emitted when new filtered data is available.
+        Qt Signal emitted when new filtered data is available (only forwarded while it
+        has receivers).
     newSourceAddedSig : Signal
         Qt Signal emitted when a new source is added.
     """
@@ -493,19 +592,42 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.moveDownButton.setIcon(QIcon.fromTheme("arrow-down", QIcon(f":icons/{theme}/down-arrow")))
         self.moveRightButton.setIcon(QIcon.fromTheme("arrow-right", QIcon(f":icons/{theme}/right-arrow")))
 
-        self._streamControllers: dict[str, StreamingController] = {}
-        self._sigPlotWidgets: dict[str, SignalPlotWidget] = {}
+        # All list items are single-line text, so their geometry can be computed once
+        self.sourceList.setUniformItemSizes(True)
+        self.sigNameList.setUniformItemSizes(True)
 
-        # Mappings
-        self._source2sigMap: dict[str, list[str]] = {}
-        self._sig2sourceMap: dict[str, str] = {}
+        self._sources: dict[str, _SourceRecord] = {}
+        self._signals: dict[str, _SignalRecord] = {}
+
+        # Plot data is buffered by the streaming controllers and forwarded to the plots
+        # (which are refreshed right after) at a fixed rate
+        self._plotTimer = QTimer(self)
+        self._plotTimer.setInterval(33)  # ~30 FPS
+        self._plotTimer.timeout.connect(
+            self._plotData, Qt.DirectConnection  # type: ignore
+        )
+
+        # Layout re-adjustments are deferred to the next event loop iteration and coalesced
+        self._adjustLayoutTimer = QTimer(self)
+        self._adjustLayoutTimer.setSingleShot(True)
+        self._adjustLayoutTimer.setInterval(0)
+        self._adjustLayoutTimer.timeout.connect(self._adjustLayout)
+
+        # While streaming, forwarding follows the receivers of dataReadySig at every
+        # plot refresh, so that modules connecting mid-stream are served too
+        self._forwardingData = False
+        self._dataReadySigMeta = QMetaMethod.fromSignal(self.dataReadySig)
+        self._plotTimer.timeout.connect(
+            self._updateForwarding, Qt.DirectConnection  # type: ignore
+        )
+
+        self._addSourceDialog: _AddSourceDialog | None = None
+        self._addSignalDialog: _AddSignalDialog | None = None
 
         # Source addition/removal
         self.addSourceButton.clicked.connect(self._addSourceHandler)
         self.deleteSourceButton.clicked.connect(self._deleteSourceHandler)
-        self.sourceList.itemClicked.connect(
-            lambda: self.deleteSourceButton.setEnabled(True)
-        )
+        self.sourceList.itemClicked.connect(self._enableDeleteSourceButton)
 
         # Signal addition/removal/moving
         # self.deleteSignalButton.clicked.connect(self._deleteSignalHandler)
@@ -520,6 +642,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.startStreamingButton.clicked.connect(self._startStreaming)
         self.stopStreamingButton.clicked.connect(self._stopStreaming)
 
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Stop streaming and notify pluggable modules before closing."""
+        # The worker threads must be stopped before the widgets are destroyed
+        if self.stopStreamingButton.isEnabled():
+            self._stopStreaming()
+        self.closeSig.emit()
+        event.accept()
+
     def addConfWidget(self, widget: QWidget) -> None:
         """
         Add a widget to configure pluggable modules.
@@ -544,64 +674,71 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         isDark = backgroundColor.lightness() < textColor.lightness()
         return "dark" if isDark else "light"
 
+    @Slot()
     def _addSourceHandler(self) -> None:
         """Handler to add a new source."""
         # Open the dialog
         self._openAddSourceDialog()
 
-    def _openAddSourceDialog(self, addSourceDialog: _AddSourceDialog | None = None):
+    def _openAddSourceDialog(self):
         """Open the dialog for adding sources."""
-        if addSourceDialog is None:
-            addSourceDialog = _AddSourceDialog(self)
+        if self._addSourceDialog is None:
+            self._addSourceDialog = _AddSourceDialog(self)
+        else:
+            self._addSourceDialog.reset()
+        addSourceDialog = self._addSourceDialog
 
-        accepted = addSourceDialog.exec()
-        if accepted:
-            # Check if input is valid
-            if not addSourceDialog.isValid:
-                QMessageBox.critical(
-                    self,
-                    "Invalid source",
-                    addSourceDialog.errMessage,
-                    buttons=QMessageBox.Retry,  # type: ignore
-                    defaultButton=QMessageBox.Retry,  # type: ignore
-                )
-                self._openAddSourceDialog(addSourceDialog)  # re-open dialog
+        # Re-open the dialog until the input is valid or the user cancels
+        while True:
+            if not addSourceDialog.exec():
                 return
-
-            # Create streaming controller
-            dataSourceConfig = addSourceDialog.dataSourceConfig
-            interfaceModule = dataSourceConfig.pop("interfaceModule")
-            dataSourceConfig["packetSize"] = interfaceModule.packetSize
-            dataSourceConfig["startSeq"] = interfaceModule.startSeq
-            dataSourceConfig["stopSeq"] = interfaceModule.stopSeq
-            streamController = StreamingController(
-                dataSourceConfig, interfaceModule.decodeFn, self
+            if addSourceDialog.isValid:
+                break
+            QMessageBox.critical(
+                self,
+                "Invalid source",
+                addSourceDialog.errMessage,
+                buttons=QMessageBox.Retry,  # type: ignore
+                defaultButton=QMessageBox.Retry,  # type: ignore
             )
-            self._streamControllers[str(streamController)] = streamController
-            self._source2sigMap[str(streamController)] = []
 
-            # Configure Qt Signals
-            streamController.dataReadySig.connect(self._plotData)
-            streamController.errorSig.connect(self._handleErrors)
-            streamController.dataReadySig.connect(
-                lambda d: self.dataReadySig.emit(d)
-            )  # forward Qt Signal for filtered data
+        # Create streaming controller
+        dataSourceConfig = addSourceDialog.dataSourceConfig
+        interfaceModule = dataSourceConfig.pop("interfaceModule")
+        dataSourceConfig["packetSize"] = interfaceModule.packetSize
+        dataSourceConfig["startSeq"] = interfaceModule.startSeq
+        dataSourceConfig["stopSeq"] = interfaceModule.stopSeq
+        streamController = StreamingController(
+            dataSourceConfig, interfaceModule.decodeFn, self
+        )
+        sourceName = streamController.name
+        self._sources[sourceName] = _SourceRecord(streamController)
 
-            # Update UI list
-            self.sourceList.addItem(str(streamController))
+        # Configure Qt Signals (errorSig and dataReadySig are emitted by the controller
+        # in the GUI thread)
+        streamController.errorSig.connect(
+            self._handleErrors, Qt.DirectConnection  # type: ignore
+        )
+        streamController.dataReadySig.connect(
+            self.dataReadySig, Qt.DirectConnection  # type: ignore
+        )
+
+        # Update UI list
+        self.sourceList.addItem(sourceName)
 
-            # Enable signal configuration
-            if not self.signalsGroupBox.isEnabled():
-                self.signalsGroupBox.setEnabled(True)
+        # Enable signal configuration
+        if not self.signalsGroupBox.isEnabled():
+            self.signalsGroupBox.setEnabled(True)
 
-            # Add signals
-            for sigName, nCh, fs in zip(
-                interfaceModule.sigNames, interfaceModule.nCh, interfaceModule.fs
-            ):
-                self._openAddSignalDialog(str(streamController), sigName, nCh, fs)
+        # Add signals
+        for sigName, nCh, fs in zip(
+            interfaceModule.sigNames, interfaceModule.nCh, interfaceModule.fs
+        ):
+            self._openAddSignalDialog(sourceName, sigName, nCh, fs)
 
-            self.newSourceAddedSig.emit(streamController)
+        self.newSourceAddedSig.emit(streamController)
 
+    @Slot()
     def _deleteSourceHandler(self) -> None:
         """Handler to remove the selected source."""
         # Get corresponding index
@@ -610,28 +747,25 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # Update UI list
         sourceToRemove = self.sourceList.takeItem(idxToRemove).text()
 
-        # Remove every signal associated with the source
-        for sigNameToRemove in self._source2sigMap[sourceToRemove]:
-            # Remove plot widget
-            plotWidgetToRemove = self._sigPlotWidgets.pop(sigNameToRemove)
-            self.plotsLayout.removeWidget(plotWidgetToRemove)
-            plotWidgetToRemove.deleteLater()
-
-            # Update UI list
-            itemToRemove = self.sigNameList.findItems(sigNameToRemove, Qt.MatchExactly)[0]  # type: ignore
-            self.sigNameList.takeItem(self.sigNameList.row(itemToRemove))
+        # Delete source record (with the streaming controller)
+        sourceRecord = self._sources.pop(sourceToRemove)
 
-            # Handle mapping
-            del self._sig2sourceMap[sigNameToRemove]
+        # Remove every signal associated with the source (repainting the plots only once)
+        plotsContainer = self.plotsLayout.parentWidget()
+        plotsContainer.setUpdatesEnabled(False)
+        for sigNameToRemove in sourceRecord.sigNames:
+            signalRecord = self._signals.pop(sigNameToRemove)
 
-        # Handle mapping
-        del self._source2sigMap[sourceToRemove]
+            # Remove plot widget
+            self.plotsLayout.removeWidget(signalRecord.plotWidget)
+            signalRecord.plotWidget.deleteLater()
 
-        # Delete streaming controller
-        del self._streamControllers[sourceToRemove]
+            # Update UI list
+            self.sigNameList.takeItem(self.sigNameList.row(signalRecord.listItem))
+        plotsContainer.setUpdatesEnabled(True)
 
         # Disable signal configuration and source deletion depending on the number of remaining sources
-        if len(self._streamControllers) == 0:
+        if len(self._sources) == 0:
             self.deleteSourceButton.setEnabled(False)
             self.signalsGroupBox.setEnabled(False)
 
@@ -640,75 +774,76 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # Open the dialog
         self._openAddSignalDialog()
 
-    def _openAddSignalDialog(
-        self,
-        sourceName: str,
-        sigName: str,
-        nCh: int,
-        fs: float,
-        addSignalDialog: _AddSignalDialog | None = None,
-    ):
+    def _openAddSignalDialog(self, sourceName: str, sigName: str, nCh: int, fs: float):
         """Open the dialog for adding signals."""
-        if addSignalDialog is None:
-            addSignalDialog = _AddSignalDialog(sourceName, sigName, nCh, fs, self)
+        if self._addSignalDialog is None:
+            self._addSignalDialog = _AddSignalDialog(sourceName, sigName, nCh, fs, self)
+        else:
+            self._addSignalDialog.reset(sourceName, sigName, nCh, fs)
+        addSignalDialog = self._addSignalDialog
 
-        accepted = addSignalDialog.exec()
-        if accepted:
-            # Check if input is valid
-            if not addSignalDialog.isValid:
-                QMessageBox.critical(
-                    self,
-                    "Invalid signal",
-                    addSignalDialog.errMessage,
-                    buttons=QMessageBox.Retry,  # type: ignore
-                    defaultButton=QMessageBox.Retry,  # type: ignore
-                )
-                self._openAddSignalDialog(
-                    sourceName, sigName, nCh, fs, addSignalDialog
-                )  # re-open dialog
+        # Re-open the dialog until the input is valid or the user cancels
+        while True:
+            if not addSignalDialog.exec():
                 return
+            if addSignalDialog.isValid:
+                break
+            QMessageBox.critical(
+                self,
+                "Invalid signal",
+                addSignalDialog.errMessage,
+                buttons=QMessageBox.Retry,  # type: ignore
+                defaultButton=QMessageBox.Retry,  # type: ignore
+            )
 
-            # Connect to streaming controller
-            source = addSignalDialog.signalConfig["source"]
-            streamController = self._streamControllers[source]
-            sigName = addSignalDialog.signalConfig["sigName"]
-            streamController.addSigName(sigName)
-
-            # Configure filtering
-            if "filtType" in addSignalDialog.signalConfig:
-                filtSettings = {
-                    "filtType": addSignalDialog.signalConfig["filtType"],
-                    "freqs": addSignalDialog.signalConfig["freqs"],
-                    "filtOrder": addSignalDialog.signalConfig["filtOrder"],
-                    "fs": addSignalDialog.signalConfig["fs"],
-                    "nCh": addSignalDialog.signalConfig["nCh"],
-                }
-                streamController.addFiltSettings(sigName, filtSettings)
-
-            # Configure file saving
-            if "filePath" in addSignalDialog.signalConfig:
-                streamController.addFileSavingSettings(
-                    sigName, addSignalDialog.signalConfig["filePath"]
-                )
-
-            # Create plot widget
-            nCh = addSignalDialog.signalConfig["nCh"]
-            fs = addSignalDialog.signalConfig["fs"]
-            renderLen = addSignalDialog.signalConfig["renderLen"]
-            chSpacing = addSignalDialog.signalConfig["chSpacing"]
-            sigPlotWidget = SignalPlotWidget(sigName, nCh, fs, renderLen, chSpacing)
-            self._sigPlotWidgets[sigName] = sigPlotWidget
-            self.plotsLayout.addWidget(sigPlotWidget)
+        # Connect to streaming controller
+        source = addSignalDialog.signalConfig["source"]
+        sourceRecord = self._sources[source]
+        streamController = sourceRecord.streamController
+        sigName = addSignalDialog.signalConfig["sigName"]
+        streamController.addSigName(sigName)
+
+        # Configure filtering
+        if "filtType" in addSignalDialog.signalConfig:
+            filtSettings = {
+                "filtType": addSignalDialog.signalConfig["filtType"],
+                "freqs": addSignalDialog.signalConfig["freqs"],
+                "filtOrder": addSignalDialog.signalConfig["filtOrder"],
+                "fs": addSignalDialog.signalConfig["fs"],
+                "nCh": addSignalDialog.signalConfig["nCh"],
+            }
+            streamController.addFiltSettings(sigName, filtSettings)
+
+        # Configure file saving
+        if "filePath" in addSignalDialog.signalConfig:
+            streamController.addFileSavingSettings(
+                sigName, addSignalDialog.signalConfig["filePath"]
+            )
 
-            # Handle mappings
-            self._source2sigMap[source].append(sigName)
-            self._sig2sourceMap[sigName] = source
+        # Create plot widget
+        nCh = addSignalDialog.signalConfig["nCh"]
+        fs = addSignalDialog.signalConfig["fs"]
+        renderLen = addSignalDialog.signalConfig["renderLen"]
+        chSpacing = addSignalDialog.signalConfig["chSpacing"]
+        sigPlotWidget = SignalPlotWidget(sigName, nCh, fs, renderLen, chSpacing)
+        self.plotsLayout.addWidget(sigPlotWidget)
 
-            # Update UI list
-            self.sigNameList.addItem(sigName)
+        # Update UI list
+        sigNameItem = QListWidgetItem(sigName)
+        self.sigNameList.addItem(sigNameItem)
+
+        # Handle records
+        sourceRecord.sigNames.append(sigName)
+        self._signals[sigName] = _SignalRecord(
+            source,
+            sigPlotWidget,
+            sigPlotWidget.addData,
+            sigPlotWidget.refreshPlot,
+            sigNameItem,
+        )
 
-            # Re-adjust layout
-            self._adjustLayout()
+        # Re-adjust layout
+        self._adjustLayoutTimer.start()
 
     def _deleteSignalHandler(self) -> None:
         """Handler to remove the selected signal."""
@@ -718,32 +853,38 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # Update UI list
         sigNameToRemove = self.sigNameList.takeItem(idxToRemove).text()
 
-        # Handle mappings
-        source = self._sig2sourceMap.pop(sigNameToRemove)
-        self._source2sigMap[source].remove(sigNameToRemove)
+        # Handle records
+        signalRecord = self._signals.pop(sigNameToRemove)
+        sourceRecord = self._sources[signalRecord.source]
+        sourceRecord.sigNames.remove(sigNameToRemove)
 
         # Remove plot widget
-        plotWidgetToRemove = self._sigPlotWidgets.pop(sigNameToRemove)
-        self.plotsLayout.removeWidget(plotWidgetToRemove)
-        plotWidgetToRemove.deleteLater()
+        self.plotsLayout.removeWidget(signalRecord.plotWidget)
+        signalRecord.plotWidget.deleteLater()
 
         # Disconnect from streaming controller
-        self._streamControllers[source].removeSigName(sigNameToRemove)
+        sourceRecord.streamController.removeSigName(sigNameToRemove)
 
         # Re-adjust layout
-        self._adjustLayout()
+        self._adjustLayoutTimer.start()
 
         # Disable signal deletion and moving, depending on the number of remaining signals
-        nSig = len(self._sigPlotWidgets)
+        nSig = len(self._signals)
         if nSig < 2:
             self.moveUpButton.setEnabled(False)
             self.moveDownButton.setEnabled(False)
             if nSig == 0:
                 self.deleteSignalButton.setEnabled(False)
 
+    @Slot()
+    def _enableDeleteSourceButton(self) -> None:
+        """Enable button to delete sources."""
+        self.deleteSourceButton.setEnabled(True)
+
+    @Slot()
     def _enableMoveButtons(self) -> None:
         """Enable buttons to move signals up/down."""
-        flag = len(self._sigPlotWidgets) >= 2
+        flag = len(self._signals) >= 2
         self.moveUpButton.setEnabled(flag)
         self.moveDownButton.setEnabled(flag)
 
@@ -751,36 +892,39 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         """Move signal up/down."""
         # Get the indexes of the elements to swap
         idxFrom = self.sigNameList.currentRow()
-        idxTo = (
-            max(0, idxFrom - 1)
-            if up
-            else min(len(self._sigPlotWidgets) - 1, idxFrom + 1)
-        )
+        idxTo = max(0, idxFrom - 1) if up else min(len(self._signals) - 1, idxFrom + 1)
         if idxFrom == idxTo:
             return
 
-        # Swap list items and plot widgets
+        # Swap list items and plot widgets (repainting the plots only once)
+        plotsContainer = self.plotsLayout.parentWidget()
+        plotsContainer.setUpdatesEnabled(False)
         item = self.sigNameList.takeItem(idxFrom)
         self.sigNameList.insertItem(idxTo, item)
-        plotWidget = self._sigPlotWidgets[item.text()]
+        self.sigNameList.setCurrentRow(idxTo)
+        plotWidget = self._signals[item.text()].plotWidget
         self.plotsLayout.removeWidget(plotWidget)
         self.plotsLayout.insertWidget(idxTo, plotWidget)
 
+        plotsContainer.setUpdatesEnabled(True)
+
         # Re-adjust layout
-        self._adjustLayout()
+        self._adjustLayoutTimer.start()
 
+    @Slot()
     def _adjustLayout(self) -> None:
         """Adjust the layout of the plots."""
         stretches = map(
-            lambda n: 2**n, list(range(len(self._sigPlotWidgets) - 2, -1, -1)) + [0]
+            lambda n: 2**n, list(range(len(self._signals) - 2, -1, -1)) + [0]
         )
         for i, s in enumerate(stretches):
             self.plotsLayout.setStretch(i, s)
 
+    @Slot()
     def _startStreaming(self) -> None:
         """Start streaming."""
         # Validate settings
-        if len(self._sigPlotWidgets) == 0:
+        if len(self._signals) == 0:
             QMessageBox.critical(
                 self,
                 "Invalid configuration",
@@ -797,18 +941,29 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.stopStreamingButton.setEnabled(True)
         self.streamConfGroupBox.setEnabled(False)
 
+        # Forward filtered data only if some pluggable module is listening
+        self._updateForwarding()
+
         # Start all StreamController objects
-        for streamController in self._streamControllers.values():
-            streamController.startStreaming()
+        self._plotTimer.start()
+        for sourceRecord in self._sources.values():
+            sourceRecord.streamController.startStreaming()
 
         # Emit "start" Qt Signal (for pluggable modules)
         self.startStreamingSig.emit()
 
+    @Slot()
     def _stopStreaming(self) -> None:
         """Stop streaming."""
         # Stop all StreamingController objects
-        for streamController in self._streamControllers.values():
-            streamController.stopStreaming()
+        for sourceRecord in self._sources.values():
+            sourceRecord.streamController.stopStreaming()
+        self._plotTimer.stop()
+        self._plotData()
+        if self._forwardingData:
+            for sourceRecord in self._sources.values():
+                sourceRecord.streamController.setForwarding(False)
+            self._forwardingData = False
 
         # Emit "stop" Qt Signal (for pluggable modules)
         self.stopStreamingSig.emit()
@@ -820,6 +975,17 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         logging.info("MainWindow: streaming stopped.")
 
+    @Slot()
+    def _updateForwarding(self) -> None:
+        """Forward the controllers' filtered data only if dataReadySig has receivers."""
+        forwardingData = self.isSignalConnected(self._dataReadySigMeta)
+        if forwardingData == self._forwardingData:
+            return
+
+        for sourceRecord in self._sources.values():
+            sourceRecord.streamController.setForwarding(forwardingData)
+        self._forwardingData = forwardingData
+
     @Slot(str)
     def _handleErrors(self, errMessage: str) -> None:
         """When an error occurs, display an alert and stop streaming."""
@@ -831,13 +997,21 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             defaultButton=QMessageBox.Retry,  # type: ignore
         )
 
-    @Slot(DataPacket)
-    def _plotData(self, dataPacket: DataPacket):
-        """Plot the given data on the corresponding plot.
-
-        Parameters
-        ----------
-        dataPacket : DataPacket
-            Data to plot.
-        """
-        self._sigPlotWidgets[dataPacket.id].addData(dataPacket.data)
+    @Slot()
+    def _plotData(self) -> None:
+        """Drain the data buffered by the streaming controllers and refresh plots."""
+        pendingData: dict[str, list[np.ndarray]] = {}
+        for sourceRecord in self._sources.values():
+            for plotPacket in sourceRecord.streamController.readPlotData():
+                for sigName, data in plotPacket.items():
+                    pendingData.setdefault(sigName, []).append(data)
+
+        signals = self._signals
+        for sigName, dataList in pendingData.items():
+            signalRecord = signals.get(sigName)
+            if signalRecord is None:
+                continue
+            signalRecord.plotFn(
+                dataList[0] if len(dataList) == 1 else np.concatenate(dataList)
+            )
+            signalRecord.refreshFn()
@@ -17,11 +17,8 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from collections import deque
-
 import numpy as np
 import pyqtgraph as pg
-from PySide6.QtCore import QTimer, Slot
 from PySide6.QtWidgets import QWidget
 
 from .ui.ui_signal_plots_widget import Ui_SignalPlotsWidget
@@ -54,12 +51,18 @@ class SignalPlotWidget(QWidget, Ui_SignalPlotsWidget):
         Sampling frequency.
     _chSpacing : int
         Spacing between each channel in the plot.
-    _xQueue : deque
-        Queue for X values.
-    _yQueue : deque
-        Queue for Y values.
-    _timer : QTimer
-        Timer for plot refreshing.
+    _chOffsets : ndarray
+        Vertical offset of each channel in the plot, with shape (nCh,).
+    _renderLength : int
+        Number of samples in the window of the plot.
+    _xBase : ndarray
+        Time values of the window of the plot relative to the latest sample, with shape (renderLength,).
+    _yBuffer : ndarray
+        Circular buffer for Y values, with shape (renderLength, nCh).
+    _writeIdx : int
+        Index of the circular buffer at which the next sample will be written.
+    _nSampTot : int
+        Total number of samples received.
     _plots : list of PlotItem
         List containing the references to the PlotItem objects.
     """
@@ -77,16 +80,15 @@ class SignalPlotWidget(QWidget, Ui_SignalPlotsWidget):
 
         self.setupUi(self)
 
-        renderLength = int(round(renderLengthS * fs))
-        self._xQueue = deque(maxlen=renderLength)
-        self._yQueue = deque(maxlen=renderLength)
         self._nCh = nCh
         self._fs = fs
         self._chSpacing = chSpacing
-        self._timer = QTimer(self)
-        self._timer.setInterval(20)  # 50 FPS
-        self._timer.timeout.connect(self._refreshPlot)
-        self._timer.start()
+        self._chOffsets = chSpacing * np.arange(nCh, 0, -1, dtype=np.float32)
+        self._renderLength = int(round(renderLengthS * fs))
+        self._xBase = np.arange(-self._renderLength + 1, 1) / fs
+        self._yBuffer = np.empty((self._renderLength, nCh), dtype=np.float32)
+        self._writeIdx = 0
+        self._nSampTot = 0
 
         # Initialize plots
         self._plots = []
@@ -101,10 +103,8 @@ class SignalPlotWidget(QWidget, Ui_SignalPlotsWidget):
         self.graphWidget.getPlotItem().hideAxis("left")  # type: ignore
         self.graphWidget.getPlotItem().setMouseEnabled(False, False)
 
-        # Initialize queues
-        for i in range(-self._xQueue.maxlen, 0):  # type: ignore
-            self._xQueue.append(i / self._fs)
-            self._yQueue.append(np.zeros(self._nCh))
+        # Initialize buffer
+        self._yBuffer[:] = self._chOffsets
 
         # Get colormap
         cm = pg.colormap.get("CET-C1")  # type: ignore
@@ -112,36 +112,47 @@ class SignalPlotWidget(QWidget, Ui_SignalPlotsWidget):
         lut = cm.getLookupTable(nPts=self._nCh, mode="qcolor")  # type: ignore
 
         # Plot placeholder data
-        ys = np.asarray(self._yQueue).T
+        xs = self._xBase - 1 / self._fs
+        ys = self._yBuffer.T
         for i in range(self._nCh):
             pen = pg.mkPen(color=lut[i], width=1)
             self._plots.append(
                 self.graphWidget.plot(
-                    self._xQueue, ys[i] + self._chSpacing * i, pen=pen
+                    xs,
+                    ys[i],
+                    pen=pen,
+                    autoDownsample=True,
+                    downsampleMethod="peak",
                 )
             )
 
-    @Slot(np.ndarray)
     def addData(self, data: np.ndarray) -> None:
         """
-        Add the given data to the internal queues.
+        Add the given data to the circular buffer, shifting each channel by its offset.
 
         Parameters
         ----------
         data : ndarray
             Data to plot.
         """
-        for samples in data:
-            self._xQueue.append(self._xQueue[-1] + 1 / self._fs)
-            self._yQueue.append(samples)
-
-    def _refreshPlot(self) -> None:
-        """Plot the given data."""
-
-        ys = np.asarray(self._yQueue).T
+        nSamp = data.shape[0]
+        self._nSampTot += nSamp
+        if nSamp >= self._renderLength:  # only the most recent samples are kept
+            data = data[-self._renderLength :]
+            nSamp = self._renderLength
+
+        # Copy with wrap-around, applying channel offsets in the same pass
+        idx = self._writeIdx
+        nFirst = min(nSamp, self._renderLength - idx)
+        np.add(data[:nFirst], self._chOffsets, out=self._yBuffer[idx : idx + nFirst])
+        np.add(data[nFirst:], self._chOffsets, out=self._yBuffer[: nSamp - nFirst])
+        self._writeIdx = (idx + nSamp) % self._renderLength
+
+    def refreshPlot(self) -> None:
+        """Render the data in the circular buffer."""
+        xs = self._xBase + (self._nSampTot - 1) / self._fs
+        # Unroll the circular buffer so that the oldest sample comes first
+        idx = self._writeIdx
+        ys = np.concatenate((self._yBuffer[idx:], self._yBuffer[:idx])).T
         for i in range(self._nCh):
-            self._plots[i].setData(
-                self._xQueue,
-                ys[i] + self._chSpacing * (self._nCh - i),
-                skipFiniteCheck=True,
-            )
+            self._plots[i].setData(xs, ys[i], skipFiniteCheck=True)
@@ -20,25 +20,60 @@ limitations under the License.
 from __future__ import annotations
 
 import struct
-from collections import namedtuple
+from collections import deque
 from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Callable, TypeAlias
+from typing import BinaryIO, Callable, TypeAlias
 
 import numpy as np
-from PySide6.QtCore import QObject, QThread, Signal, Slot
+from PySide6.QtCore import QObject, Qt, QThread, Signal, Slot
 from scipy import signal
 
 from . import data_source
 
 DecodeFn: TypeAlias = Callable[[bytes], Sequence[np.ndarray]]
 
-InterfaceModule = namedtuple(
-    "InterfaceModule", "packetSize, startSeq, stopSeq, fs, nCh, sigNames, decodeFn"
-)
 
+@dataclass(slots=True, frozen=True)
+class InterfaceModule:
+    """
+    Dataclass describing an interface module.
+
+    Attributes
+    ----------
+    packetSize : int
+        Number of bytes in each packet.
+    startSeq : list of bytes
+        Sequence of commands to start the device.
+    stopSeq : list of bytes
+        Sequence of commands to stop the device.
+    fs : list of float
+        Sampling frequency of each signal.
+    nCh : list of int
+        Number of channels of each signal.
+    sigNames : tuple of str
+        Name of each signal.
+    decodeFn : DecodeFn
+        Function to decode a packet of bytes into the data of each signal.
+    """
+
+    packetSize: int
+    startSeq: list[bytes]
+    stopSeq: list[bytes]
+    fs: list[float]
+    nCh: list[int]
+    sigNames: tuple[str, ...]
+    decodeFn: DecodeFn
 
-@dataclass
+
+PLOT_BUFFER_LEN = 1024
+"""Maximum number of packets buffered for plotting (older packets are dropped if the GUI lags behind)."""
+
+FILE_BUFFER_SIZE = 1 << 20
+"""Size (in bytes) of the write buffer of each output file (packets are coalesced in few system calls)."""
+
+
+@dataclass(slots=True, frozen=True)
 class DataPacket:
     """
     Dataclass describing a data packet.
@@ -48,44 +83,56 @@ class DataPacket:
     id : str
         String identifier.
     data : ndarray
-        Data packet with shape (nSamp, nCh).
+        Data packet with shape (nSamp, nCh), stored as a C-contiguous float32 array.
     """
 
     id: str
     data: np.ndarray
 
 
-class _FileWriterWorker(QObject):
+@dataclass(slots=True)
+class _OutputFile:
     """
-    Worker that writes into a file the data it receives via a Qt signal.
+    Dataclass grouping the state associated to an output file.
 
-    Parameters
+    Attributes
     ----------
     filePath : str
         File path.
-    targetSignalName : str
-        Target signal name.
+    f : BinaryIO or None
+        File object.
+    firstWrite : bool
+        Whether it's the first time data is written to the file.
+    outBuf : ndarray or None
+        Buffer re-used to append the trigger column to the data, with shape
+        (capacity, nCh + 1); it only grows with the number of samples per packet.
+    outBufTrigger : int or None
+        Trigger value currently stored in the last column of the buffer.
+    """
+
+    filePath: str
+    f: BinaryIO | None = None
+    firstWrite: bool = True
+    outBuf: np.ndarray | None = None
+    outBufTrigger: int | None = None
+
+
+class _FileWriterWorker(QObject):
+    """
+    Worker that writes into files the data it receives via a Qt signal.
 
     Attributes
     ----------
-    _filePath : str
-        File path.
-    _targetSignalName : str
-        Target signal name.
-    _f : BinaryIO or None
-        File object.
-    _firstWrite : bool
-        Whether it's the first time the worker receives data.
+    _outFiles : dict of str: _OutputFile
+        Dictionary of output files indexed by the name of the signal they store.
+    _trigger : int or None
+        Trigger appended as an additional channel to the data (if set).
     """
 
-    def __init__(self, filePath: str, targetSignalName: str) -> None:
+    def __init__(self) -> None:
         super().__init__()
 
-        self._filePath = filePath
-        self._targetSignalName = targetSignalName
-
-        self._f = None
-        self._firstWrite = True
+        self._outFiles: dict[str, _OutputFile] = {}
         self._trigger = None
 
     @property
@@ -97,6 +144,40 @@ class _FileWriterWorker(QObject):
     def trigger(self, trigger: int) -> None:
         self._trigger = trigger
 
+    @property
+    def nFiles(self) -> int:
+        """int: Property representing the number of output files."""
+        return len(self._outFiles)
+
+    def addFile(self, sigName: str, filePath: str) -> None:
+        """
+        Add an output file for the given signal.
+
+        Parameters
+        ----------
+        sigName : str
+            Signal name.
+        filePath : str
+            File path.
+        """
+        self._outFiles[sigName] = _OutputFile(filePath)
+
+    def removeFile(self, sigName: str) -> bool:
+        """
+        Remove the output file for the given signal, if any.
+
+        Parameters
+        ----------
+        sigName : str
+            Signal name.
+
+        Returns
+        -------
+        bool
+            Whether an output file was removed.
+        """
+        return self._outFiles.pop(sigName, None) is not None
+
     @Slot(DataPacket)
     def write(self, dataPacket: DataPacket) -> None:
         """
@@ -107,36 +188,72 @@ class _FileWriterWorker(QObject):
         dataPacket : DataPacket
             Data to write.
         """
-        if dataPacket.id != self._targetSignalName:
+        outFile = self._outFiles.get(dataPacket.id)
+        if outFile is None:
             return
         data = dataPacket.data
 
-        if self._firstWrite:  # write number of channels
+        if outFile.firstWrite:  # write number of channels
             nCh = data.shape[1] + 1 if self._trigger is not None else data.shape[1]
-            self._f.write(struct.pack("<I", nCh))  # type: ignore
-            self._firstWrite = False
-            print(self._trigger)
-
-        # Add trigger (optionally)
-        if self._trigger is not None:
-            data = np.concatenate(
-                [
-                    data,
-                    np.repeat(self._trigger, data.shape[0]).reshape(-1, 1),
-                ],
-                axis=1,
-            ).astype("float32")
-
-        self._f.write(data.tobytes())  # type: ignore
+            outFile.f.write(struct.pack("<I", nCh))  # type: ignore
+            outFile.firstWrite = False
+
+        # Add trigger (optionally), filling a pre-allocated buffer in place
+        trigger = self._trigger  # read once, since it is set from another thread
+        if trigger is not None:
+            nSamp, nCh = data.shape
+            outBuf = outFile.outBuf
+            if outBuf is None or outBuf.shape[0] < nSamp or outBuf.shape[1] != nCh + 1:
+                outBuf = outFile.outBuf = np.empty((nSamp, nCh + 1), dtype=np.float32)
+                outFile.outBufTrigger = None
+            # The trigger column is only re-filled when the trigger changes
+            if outFile.outBufTrigger != trigger:
+                outBuf[:, nCh] = trigger
+                outFile.outBufTrigger = trigger
+            data = outBuf[:nSamp]
+            data[:, :nCh] = dataPacket.data
+
+        # The array (or the leading rows of the buffer) is C-contiguous,
+        # hence it can be written without copying it
+        outFile.f.write(memoryview(data))  # type: ignore
+
+    @Slot()
+    def openFiles(self) -> None:
+        """Open the files."""
+        for outFile in self._outFiles.values():
+            outFile.f = open(outFile.filePath, "wb", buffering=FILE_BUFFER_SIZE)
+            outFile.firstWrite = True
+
+    @Slot()
+    def closeFiles(self) -> None:
+        """Close the files."""
+        for outFile in self._outFiles.values():
+            if outFile.f is not None:
+                outFile.f.close()
+                outFile.f = None
+
+
+@dataclass(slots=True)
+class _SignalState:
+    """
+    Dataclass grouping the pre-processing state of a signal.
 
-    def openFile(self) -> None:
-        """Open the file."""
-        self._f = open(self._filePath, "wb")
-        self._firstWrite = True
+    Attributes
+    ----------
+    sigName : str
+        Name of the signal.
+    sos : ndarray or None
+        Filter coefficients, or None if the signal is not filtered.
+    zi : ndarray or None
+        Filter state, or None if the signal is not filtered.
+    nCh : int or None
+        Number of channels expected by the filter, or None if the signal is not filtered.
+    """
 
-    def closeFile(self) -> None:
-        """Close the file."""
-        self._f.close()  # type: ignore
+    sigName: str
+    sos: np.ndarray | None = None
+    zi: np.ndarray | None = None
+    nCh: int | None = None
 
 
 class _PreprocessWorker(QObject):
@@ -147,17 +264,22 @@ class _PreprocessWorker(QObject):
     ----------
     decodeFn : DecodeFn
         Decode function.
+    plotBuffer : deque of dict of str: ndarray
+        Buffer shared with the GUI thread in which the filtered data is stored for plotting.
 
     Attributes
     ----------
     _decodeFn : DecodeFn
         Decode function.
-    _sigNames : list of str
-        List of signal names associated to the source.
-    _sos : dict
-        Dictionary with filters.
-    _zi : dict
-        Dictionary with filter states.
+    _plotBuffer : deque of dict of str: ndarray
+        Buffer shared with the GUI thread in which the filtered data is stored for plotting
+        (one entry per packet, mapping each signal name to its data).
+    _signals : list of _SignalState
+        Pre-processing state of the signals associated to the source, in decoding order.
+    _packetBuffer : deque of bytes
+        Buffer filled by the data source thread with the packets of bytes to preprocess.
+    _drainPending : bool
+        Whether the worker has already been notified of the packets in the buffer.
 
     Class attributes
     ----------------
@@ -167,21 +289,33 @@ class _PreprocessWorker(QObject):
         Qt Signal emitted when new filtered data is available.
     errorSig : Signal
         Qt Signal emitted when a configuration error occurs.
+    _packetsReadySig : Signal
+        Qt Signal emitted when the packet buffer becomes non-empty.
     """
 
     dataReadyRawSig = Signal(DataPacket)
     dataReadyFltSig = Signal(DataPacket)
     errorSig = Signal(str)
+    _packetsReadySig = Signal()
 
-    def __init__(self, decodeFn: DecodeFn) -> None:
+    def __init__(
+        self, decodeFn: DecodeFn, plotBuffer: deque[dict[str, np.ndarray]]
+    ) -> None:
         super().__init__()
 
         self._decodeFn = decodeFn
-        self._sigNames: list[str] = []
-        self._sos: dict = {}
-        self._zi: dict = {}
+        self._plotBuffer = plotBuffer
+        self._signals: list[_SignalState] = []
         self._errorOccurred = False
 
+        # Packets are handed over by the data source thread through a deque (appending
+        # and popping are thread-safe), waking up the worker once per batch of packets
+        self._packetBuffer: deque[bytes] = deque()
+        self._drainPending = False
+        self._packetsReadySig.connect(
+            self._drainPackets, Qt.QueuedConnection  # type: ignore
+        )
+
     @property
     def errorOccurred(self):
         """bool: Whether an error has occurred or not (useful to limit the number of error signals emitted)."""
@@ -200,7 +334,7 @@ class _PreprocessWorker(QObject):
         sigName : str
             Signal name to add.
         """
-        self._sigNames.append(sigName)
+        self._signals.append(_SignalState(sigName))
 
     def removeSigName(self, sigName: str) -> None:
         """
@@ -211,11 +345,7 @@ class _PreprocessWorker(QObject):
         sigName : str
             Signal name to remove.
         """
-        self._sigNames.remove(sigName)
-
-        # Remove filters
-        self._sos.pop(sigName, None)
-        self._zi.pop(sigName, None)
+        self._signals = [s for s in self._signals if s.sigName != sigName]
 
     def configFilter(self, sigName: str, filtSettings: dict) -> None:
         """
@@ -236,19 +366,63 @@ class _PreprocessWorker(QObject):
             btype=filtSettings["filtType"],
             output="sos",
         )
-        self._sos[sigName] = sos
-        self._zi[sigName] = np.zeros((sos.shape[0], 2, filtSettings["nCh"]))
+        # Keep filter coefficients and state in float32, so that filtering preserves the packets' dtype
+        sigState = next(s for s in self._signals if s.sigName == sigName)
+        sigState.sos = sos.astype(np.float32)
+        sigState.zi = np.zeros((sos.shape[0], 2, filtSettings["nCh"]), dtype=np.float32)
+        sigState.nCh = filtSettings["nCh"]
 
     @Slot(bytes)
-    def preprocess(self, data: bytes) -> None:
+    def enqueue(self, data: bytes) -> None:
         """
-        Decode the received packet of bytes and apply filtering.
+        Buffer the received packet of bytes (called in the thread of the data source).
 
         Parameters
         ----------
         data : bytes
             New data.
         """
+        self._packetBuffer.append(data)
+        if not self._drainPending:
+            self._drainPending = True
+            self._packetsReadySig.emit()
+
+    def clearPacketBuffer(self) -> None:
+        """Discard the buffered packets of bytes."""
+        self._packetBuffer.clear()
+        self._drainPending = False
+
+    @Slot()
+    def _drainPackets(self) -> None:
+        """Decode the buffered packets and preprocess them as a single batch."""
+        # Reset the flag before draining, so that later packets trigger a new wake-up
+        self._drainPending = False
+        popleft = self._packetBuffer.popleft
+        batch: list[list[np.ndarray]] = [[] for _ in self._signals]
+        while self._packetBuffer:
+            dataDecList = self._decode(popleft())
+            if dataDecList is None:
+                continue
+            for sigBatch, dataDec in zip(batch, dataDecList):
+                sigBatch.append(dataDec)
+
+        if len(batch) > 0 and len(batch[0]) > 0:
+            self.preprocess(batch)
+
+    def _decode(self, data: bytes) -> Sequence[np.ndarray] | None:
+        """
+        Decode the received packet of bytes.
+
+        Parameters
+        ----------
+        data : bytes
+            New data.
+
+        Returns
+        -------
+        Sequence of ndarray or None
+            Decoded data for each signal, or None if decoding failed.
+        """
         try:
             dataDecList = self._decodeFn(data)
         except (Exception,) as e:
@@ -257,24 +431,55 @@ class _PreprocessWorker(QObject):
                     f"The provided decode function failed with the following exception:\n{e}."
                 )
                 self._errorOccurred = True
-            return
+            return None
 
-        if len(dataDecList) != len(self._sigNames):
+        if len(dataDecList) != len(self._signals):
             if not self._errorOccurred:
                 self.errorSig.emit(
                     "The provided decode function and configured signals do not match."
                 )
                 self._errorOccurred = True
-            return
+            return None
+
+        return dataDecList
 
-        for sigName, dataDec in zip(self._sigNames, dataDecList):
-            self.dataReadyRawSig.emit(DataPacket(sigName, dataDec))
+    def preprocess(self, batch: list[list[np.ndarray]]) -> None:
+        """
+        Apply filtering to a batch of decoded data and emit the results.
+
+        Parameters
+        ----------
+        batch : list of list of ndarray
+            Decoded data for each signal, as a list of consecutive packets.
+        """
+        # Bind the callables used in the loop to locals
+        emitRaw = self.dataReadyRawSig.emit
+        emitFlt = self.dataReadyFltSig.emit
+        sosfilt = signal.sosfilt
+
+        plotPacket: dict[str, np.ndarray] = {}
+        for sigState, sigBatch in zip(self._signals, batch):
+            sigName = sigState.sigName
+            # Enforce a C-contiguous float32 layout shared by all the consumers (no copy if already compliant)
+            if len(sigBatch) == 1:
+                dataDec = np.ascontiguousarray(sigBatch[0], dtype=np.float32)
+            else:
+                dataDec = np.concatenate(sigBatch, dtype=np.float32)
+            emitRaw(DataPacket(sigName, dataDec))
 
             # Filter
-            if sigName in self._sos:
+            if sigState.sos is not None:
+                # Reject packets not matching the filter before calling into SciPy
+                if dataDec.ndim != 2 or dataDec.shape[1] != sigState.nCh:
+                    if not self._errorOccurred:
+                        self.errorSig.emit(
+                            f'The number of channels of signal "{sigName}" does not match the filter settings.'
+                        )
+                        self._errorOccurred = True
+                    return
                 try:
-                    dataDec, self._zi[sigName] = signal.sosfilt(
-                        self._sos[sigName], dataDec, axis=0, zi=self._zi[sigName]
+                    dataDec, sigState.zi = sosfilt(
+                        sigState.sos, dataDec, axis=0, zi=sigState.zi
                     )
                 except ValueError:
                     if not self._errorOccurred:
@@ -284,7 +489,10 @@ class _PreprocessWorker(QObject):
                         self._errorOccurred = True
                     return
 
-            self.dataReadyFltSig.emit(DataPacket(sigName, dataDec))
+            plotPacket[sigName] = dataDec
+            emitFlt(DataPacket(sigName, dataDec))
+
+        self._plotBuffer.append(plotPacket)
 
 
 class StreamingController(QObject):
@@ -310,15 +518,21 @@ class StreamingController(QObject):
         Worker for data pre-processing.
     _preprocessThread : QThread
         The QThread associated to the pre-processing worker.
-    _fileWriterWorkers : list of _FileWriterWorker
-        List of the (optional) workers for writing data to file.
-    _fileWriterThreads : list of QThread
-        List of the (optional) QThread associated to the file writer worker.
+    _fileWriterWorker : _FileWriterWorker
+        Worker for writing data to file (shared by all the signals).
+    _fileWriterThread : QThread
+        The QThread associated to the file writer worker (started only if there are files).
+    _name : str
+        String representation of the data source (cached, since it never changes).
+    _plotBuffer : deque of dict of str: ndarray
+        Buffer filled by the pre-processing worker and drained by the GUI thread with the filtered data to plot.
+    _forwarding : bool
+        Whether the filtered data is forwarded via dataReadySig.
 
     Class attributes
     ----------------
     dataReadySig : Signal
-        Qt Signal emitted when new filtered data is available.
+        Qt Signal emitted when new filtered data is available (if forwarding is on).
     errorSig : Signal
         Qt Signal emitted when an error occurs.
     """
@@ -338,34 +552,54 @@ class StreamingController(QObject):
         self._dataSourceWorker = data_source.getDataSource(**dataSourceConfig)
         self._dataSourceThread = QThread(self)
         self._dataSourceWorker.moveToThread(self._dataSourceThread)
+        self._name = str(self._dataSourceWorker)
 
-        # Create pre-processing worker and thread
-        self._preprocessWorker = _PreprocessWorker(decodeFn)
+        # Create pre-processing worker and thread, sharing the plot buffer with the GUI thread
+        # (appending and popping from a deque is thread-safe, so no lock is needed)
+        self._plotBuffer: deque[dict[str, np.ndarray]] = deque(maxlen=PLOT_BUFFER_LEN)
+        self._preprocessWorker = _PreprocessWorker(decodeFn, self._plotBuffer)
         self._preprocessThread = QThread(self)
         self._preprocessWorker.moveToThread(self._preprocessThread)
 
-        # Handle signals
+        # Handle signals: the workers live in different threads than each other and than
+        # the controller (GUI thread), hence every hop between them is explicitly queued
+        # (except for the data source's bytes packets, delivered directly to the
+        # pre-processing worker's enqueue, which buffers them itself)
         self._dataSourceThread.started.connect(self._dataSourceWorker.startCollecting)
         self._dataSourceThread.finished.connect(self._dataSourceWorker.stopCollecting)
-        self._dataSourceWorker.dataReadySig.connect(self._preprocessWorker.preprocess)
-        self._dataSourceWorker.errorSig.connect(self._handleErrors)
-        self._preprocessWorker.dataReadyFltSig.connect(
-            lambda d: self.dataReadySig.emit(d)
-        )  # forward filtered data
-        self._preprocessWorker.errorSig.connect(self._handleErrors)
+        self._dataSourceWorker.dataReadySig.connect(
+            self._preprocessWorker.enqueue, Qt.DirectConnection  # type: ignore
+        )
+        self._dataSourceWorker.errorSig.connect(
+            self._handleErrors, Qt.QueuedConnection  # type: ignore
+        )
+        self._preprocessWorker.errorSig.connect(
+            self._handleErrors, Qt.QueuedConnection  # type: ignore
+        )
 
-        # Optionally, create file writer worker and thread
-        self._fileWriterWorkers: list[_FileWriterWorker] = []
-        self._fileWriterThreads: list[QThread] = []
+        # Filtered data is forwarded to the GUI thread only on demand
+        self._forwarding = False
+
+        # Create file writer worker and thread (connected only when files are added)
+        self._fileWriterWorker = _FileWriterWorker()
+        self._fileWriterThread = QThread(self)
+        self._fileWriterWorker.moveToThread(self._fileWriterThread)
+        self._fileWriterThread.started.connect(self._fileWriterWorker.openFiles)
+        self._fileWriterThread.finished.connect(self._fileWriterWorker.closeFiles)
 
     def __str__(self) -> str:
-        return str(self._dataSourceWorker)
+        return self._name
+
+    @property
+    def name(self) -> str:
+        """str: Property for getting the name of the data source."""
+        return self._name
 
     @Slot(str)
     def _handleErrors(self, errMessage: str) -> None:
         """When error occurs, stop collection and preprocessing and forward the error Qt Signal."""
         self.stopStreaming()
-        self.errorSig.emit(f'StreamingController "{self.__str__()}": {errMessage}')
+        self.errorSig.emit(f'StreamingController "{self._name}": {errMessage}')
 
     def addSigName(self, sigName: str) -> None:
         """
@@ -389,6 +623,15 @@ class StreamingController(QObject):
         """
         self._preprocessWorker.removeSigName(sigName)
 
+        # Remove file saving settings (disconnecting the file writer if no file is left)
+        if (
+            self._fileWriterWorker.removeFile(sigName)
+            and self._fileWriterWorker.nFiles == 0
+        ):
+            self._preprocessWorker.dataReadyRawSig.disconnect(
+                self._fileWriterWorker.write
+            )
+
     def addFiltSettings(self, sigName: str, filtSettings: dict) -> None:
         """
         Configure a per-signal filter from the given settings.
@@ -404,7 +647,7 @@ class StreamingController(QObject):
 
     def addFileSavingSettings(self, sigName: str, filePath: str) -> None:
         """
-        Configure a per-signal file writer worker and thread.
+        Configure a per-signal output file.
 
         Parameters
         ----------
@@ -413,40 +656,69 @@ class StreamingController(QObject):
         filePath : str
             Path to the output file.
         """
-        # Create worker and thread
-        fileWriterWorker = _FileWriterWorker(filePath, sigName)
-        fileWriterThread = QThread(self)
-        fileWriterWorker.moveToThread(fileWriterThread)
-
-        # Handle signals
-        fileWriterThread.started.connect(fileWriterWorker.openFile)
-        fileWriterThread.finished.connect(fileWriterWorker.closeFile)
-        self._preprocessWorker.dataReadyRawSig.connect(fileWriterWorker.write)
-
-        self._fileWriterWorkers.append(fileWriterWorker)
-        self._fileWriterThreads.append(fileWriterThread)
+        # The raw data is forwarded to the file writer only when the first file is added
+        if self._fileWriterWorker.nFiles == 0:
+            self._preprocessWorker.dataReadyRawSig.connect(
+                self._fileWriterWorker.write, Qt.QueuedConnection  # type: ignore
+            )
+        self._fileWriterWorker.addFile(sigName, filePath)
 
     def setTrigger(self, trigger: int) -> None:
         """
-        Set the trigger for each file writer worker.
+        Set the trigger for the file writer worker.
 
         Parameters
         ----------
         trigger : int
             Trigger value.
         """
-        for fileWriterWorker in self._fileWriterWorkers:
-            fileWriterWorker.trigger = trigger
+        self._fileWriterWorker.trigger = trigger
+
+    def setForwarding(self, forward: bool) -> None:
+        """
+        Enable or disable the forwarding of the filtered data via dataReadySig.
+
+        Parameters
+        ----------
+        forward : bool
+            Whether to forward the filtered data.
+        """
+        if forward == self._forwarding:
+            return
+
+        if forward:
+            self._preprocessWorker.dataReadyFltSig.connect(
+                self.dataReadySig, Qt.QueuedConnection  # type: ignore
+            )
+        else:
+            self._preprocessWorker.dataReadyFltSig.disconnect(self.dataReadySig)
+        self._forwarding = forward
+
+    def readPlotData(self) -> list[dict[str, np.ndarray]]:
+        """
+        Pop all the filtered data packets buffered for plotting.
+
+        Returns
+        -------
+        list of dict of str: ndarray
+            Buffered data packets, in order of arrival, each mapping the signal names to the
+            corresponding data.
+        """
+        popleft = self._plotBuffer.popleft
+        return [popleft() for _ in range(len(self._plotBuffer))]
 
     def startStreaming(self) -> None:
         """Start streaming."""
         self._preprocessWorker.errorOccurred = False  # reset flag
+        self._preprocessWorker.clearPacketBuffer()
+        self._plotBuffer.clear()
 
-        for fileWriterThread in self._fileWriterThreads:
-            fileWriterThread.start()
+        if self._fileWriterWorker.nFiles > 0:
+            self._fileWriterThread.start()
 
-        self._preprocessThread.start()
-        self._dataSourceThread.start()
+        # Schedule acquisition and pre-processing ahead of the GUI thread (less jitter)
+        self._preprocessThread.start(QThread.HighPriority)  # type: ignore
+        self._dataSourceThread.start(QThread.HighPriority)  # type: ignore
 
     def stopStreaming(self) -> None:
         """Stop streaming."""
@@ -457,6 +729,5 @@ class StreamingController(QObject):
         self._preprocessThread.quit()
         self._preprocessThread.wait()
 
-        for fileWriterThread in self._fileWriterThreads:
-            fileWriterThread.quit()
-            fileWriterThread.wait()
+        self._fileWriterThread.quit()
+        self._fileWriterThread.wait()
@@ -17,7 +17,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import struct
 from collections import namedtuple
 
 import numpy as np
@@ -68,22 +67,13 @@ def decodeFn(data: bytes) -> SigsPacket:
     gain = 6.0
     nBit = 24
 
-    dataTmp = bytearray(
-        data[2:26]
-        + data[34:58]
-        + data[66:90]
-        + data[98:122]
-        + data[130:154]
-        + data[162:186]
-        + data[194:218]
-    )
+    # View the packet as blocks of 32 bytes, keeping the 24-byte payload of each sample
+    dataTmp = np.frombuffer(data, dtype=np.uint8)[: nSamp * 32].reshape(nSamp, 32)
+    dataTmp = dataTmp[:, 2:26].astype(np.int32).reshape(-1, 3)
+
     # Convert 24-bit to 32-bit integer
-    pos = 0
-    for _ in range(len(dataTmp) // 3):
-        prefix = 255 if dataTmp[pos] > 127 else 0
-        dataTmp.insert(pos, prefix)
-        pos += 4
-    emg = np.asarray(struct.unpack(f">{nSamp * 8}i", dataTmp), dtype=np.int32)
+    emg = (dataTmp[:, 0] << 16) | (dataTmp[:, 1] << 8) | dataTmp[:, 2]
+    emg -= (emg & 0x800000) << 1  # sign extension
 
     # Reshape and convert ADC readings to uV
     emg = emg.reshape(nSamp, 8)
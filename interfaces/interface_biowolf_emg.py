@@ -17,7 +17,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import struct
 from collections import namedtuple
 
 import numpy as np
@@ -60,18 +59,14 @@ def decodeFn(data: bytes) -> SigsPacket:
     gain = 6.0
     nBit = 24
 
-    emg = np.zeros(shape=(0, 16), dtype=np.int32)
-    for i in range(4):  # additional buffering of 4
-        dataTmp = bytearray(data)[i * 243 + 2 : (i + 1) * 243 - 1]
-
-        # Convert 24-bit to 32-bit integer
-        pos = 0
-        for _ in range(len(dataTmp) // 3):
-            prefix = 255 if dataTmp[pos] > 127 else 0
-            dataTmp.insert(pos, prefix)
-            pos += 4
-        emgTmp = np.asarray(struct.unpack(f">{5 * 16}i", dataTmp), dtype=np.int32)
-        emg = np.concatenate([emg, emgTmp.reshape(5, 16)])
+    # View the packet as 4 blocks (additional buffering of 4), keeping the payload of each
+    dataTmp = np.frombuffer(data, dtype=np.uint8).reshape(4, 243)[:, 2:242]
+    dataTmp = dataTmp.astype(np.int32).reshape(-1, 3)
+
+    # Convert 24-bit to 32-bit integer
+    emg = (dataTmp[:, 0] << 16) | (dataTmp[:, 1] << 8) | dataTmp[:, 2]
+    emg -= (emg & 0x800000) << 1  # sign extension
+    emg = emg.reshape(-1, 16)
 
     # Convert ADC readings to uV
     emg = emg * (vRef / gain / 2**nBit)  # V
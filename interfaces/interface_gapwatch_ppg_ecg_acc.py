@@ -17,7 +17,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import struct
 from collections import namedtuple
 
 import numpy as np
@@ -56,30 +55,18 @@ def decodeFn(data: bytes) -> SigsPacket:
         Named tuple containing the PPG, ECG and accelerometer packets, each with shape (nSamp, nCh).
     """
 
-    # Split bytes into PPG, ECG and accelerometer
-    ppgBytes = bytearray(data[:30] + data[68:98] + data[136:166])
-    ecgBytes1 = bytearray(data[30:60] + data[98:128] + data[166:196])
-    accelBytes = bytearray(data[60:66] + data[128:134] + data[196:202])
-    ecgBytes2 = []
-
-    # Convert to 32-bit integer
-    pos = 0
-    for _ in range(len(ppgBytes) // 3):
-        ppgBytes.insert(pos, 0)
-
-        # Handle ECG format
-        ecgBytes1.insert(pos, 0)
-        ecgTmp = struct.unpack(">I", ecgBytes1[pos : pos + 4])[0] >> 6
-        ecgByte = bytearray(struct.pack(">I", ecgTmp))
-        if ecgByte[1] > 1:
-            ecgByte[0] = 255
-            ecgByte[1] |= 252
-        ecgBytes2.append(struct.unpack(">i", ecgByte)[0])
-
-        pos += 4
-    ppg = np.asarray(struct.unpack(">30i", ppgBytes), dtype=np.int32)
-    ecg = np.asarray(ecgBytes2, dtype=np.int32)
-    acc = np.asarray(struct.unpack("<9h", accelBytes), dtype=np.int32)
+    # View the packet as 3 blocks of 68 bytes, each containing PPG, ECG and accelerometer
+    dataTmp = np.frombuffer(data, dtype=np.uint8).reshape(3, 68)
+    ppgBytes = dataTmp[:, :30].astype(np.int32).reshape(-1, 3)
+    ecgBytes = dataTmp[:, 30:60].astype(np.int32).reshape(-1, 3)
+    accBytes = np.ascontiguousarray(dataTmp[:, 60:66])
+
+    # Convert 24-bit to 32-bit unsigned integer
+    ppg = (ppgBytes[:, 0] << 16) | (ppgBytes[:, 1] << 8) | ppgBytes[:, 2]
+    # Handle ECG format (18-bit signed integer in the upper bits of 24)
+    ecg = ((ecgBytes[:, 0] << 16) | (ecgBytes[:, 1] << 8) | ecgBytes[:, 2]) >> 6
+    ecg -= (ecg & 0x20000) << 1  # sign extension
+    acc = accBytes.view("<i2").astype(np.int32)
 
     # ADC parameters
     vRefECG = 1.0
@@ -0,0 +1,93 @@
+"""
+Tests for the streaming controller.
+
+
+Copyright 2024 Mattia Orlandi, Pierangelo Maria Rapa
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QCoreApplication, QEvent, QObject
+
+from biogui.data_source import DataSourceType
+from biogui.stream_controller import DataPacket, StreamingController
+
+
+class _MetaCallCounter(QObject):
+    """Event filter counting the queued calls delivered to the watched object."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.nMetaCalls = 0
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.MetaCall:  # type: ignore
+            self.nMetaCalls += 1
+        return False
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def streamController(app):
+    dataSourceConfig = {
+        "dataSourceType": DataSourceType.DUMMY,
+        "packetSize": 0,
+        "startSeq": [],
+        "stopSeq": [],
+    }
+    streamController = StreamingController(dataSourceConfig, lambda data: ())
+    yield streamController
+    streamController.deleteLater()
+
+
+def _emitFiltered(streamController: StreamingController) -> DataPacket:
+    """Emit a filtered data packet from the pre-processing worker and process events."""
+    dataPacket = DataPacket("sig1", np.zeros((4, 2), dtype=np.float32))
+    streamController._preprocessWorker.dataReadyFltSig.emit(dataPacket)
+    QCoreApplication.processEvents()
+    return dataPacket
+
+
+def test_no_forwarding_posts_no_event(streamController):
+    counter = _MetaCallCounter()
+    streamController.installEventFilter(counter)
+    received = []
+    streamController.dataReadySig.connect(received.append)
+
+    _emitFiltered(streamController)
+
+    assert counter.nMetaCalls == 0
+    assert received == []
+
+
+def test_forwarding_on_demand(streamController):
+    counter = _MetaCallCounter()
+    streamController.installEventFilter(counter)
+    received = []
+    streamController.dataReadySig.connect(received.append)
+
+    streamController.setForwarding(True)
+    dataPacket = _emitFiltered(streamController)
+    assert counter.nMetaCalls == 1
+    assert len(received) == 1 and received[0].id == dataPacket.id
+
+    streamController.setForwarding(False)
+    _emitFiltered(streamController)
+    assert counter.nMetaCalls == 1
+    assert len(received) == 1